@@ -1,9 +1,8 @@
 """Schmeas are stored here"""
 
-from duckdb import connect
+from duckdb import DuckDBPyConnection, connect
 
 PATH = ""
-con = connect(database=PATH)
 
 sql_statements = [
     """CREATE TABLE expenses (
@@ -64,12 +63,32 @@ sql_statements = [
     );""",
 ]
 
-for sql_statement in sql_statements:
-    con.execute(sql_statement)
-    print(
-        f"Executed: {sql_statement.split('(', maxsplit=1)[0].replace('CREATE TABLE ', '')}"
-    )
 
-# Verify table creation
-print("\nTables created in DuckDB:")
-print(con.execute("SHOW TABLES;").fetchdf())
+def create_tables(con: DuckDBPyConnection) -> None:
+    """Create all tables on an existing connection
+
+    Transaction handling is left to the caller so schema creation can share
+    the pipeline's single transaction.
+    """
+    for sql_statement in sql_statements:
+        con.execute(sql_statement)
+        table = sql_statement.split("(", maxsplit=1)[0].replace("CREATE TABLE ", "")
+        print(f"Executed: {table}")
+
+
+if __name__ == "__main__":
+    connection = connect(database=PATH)
+    try:
+        connection.begin()
+        try:
+            create_tables(connection)
+        except Exception:
+            connection.rollback()
+            raise
+        connection.commit()
+
+        # Verify table creation
+        print("\nTables created in DuckDB:")
+        print(connection.execute("SHOW TABLES;").fetchdf())
+    finally:
+        connection.close()
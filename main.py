@@ -2,11 +2,45 @@
 Main: Entry point of the project
 """
 
+import os
+
+from duckdb import DuckDBPyConnection, connect
+
+from db.schemas import PATH, create_tables
+
+# Unset keeps DuckDB's default (80% of RAM) so out-of-core spilling still works
+MEMORY_LIMIT = os.environ.get("SMARTBUDGET_MEMORY_LIMIT")
+
+
+def configure_connection(con: DuckDBPyConnection) -> None:
+    """Tune DuckDB for a single-connection, order-insensitive ETL run"""
+    # process_cpu_count() honours CPU affinity, e.g. inside a limited container
+    con.execute(f"PRAGMA threads={os.process_cpu_count() or 1};")
+    if MEMORY_LIMIT:
+        con.execute("SET memory_limit = ?;", [MEMORY_LIMIT])
+    # Nothing downstream depends on row order, so let DuckDB parallelise freely
+    con.execute("PRAGMA preserve_insertion_order=false;")
+
 
 def main() -> None:
     """Code for function main()"""
     print("Hello from smartbudget02!")
 
+    # One connection and one transaction for every stage; a single commit
+    # at the end instead of one per stage
+    con = connect(database=PATH)
+    try:
+        configure_connection(con)
+        con.begin()
+        try:
+            create_tables(con)
+        except Exception:
+            con.rollback()
+            raise
+        con.commit()
+    finally:
+        con.close()
+
 
 if __name__ == "__main__":
     main()